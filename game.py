@@ -1,8 +1,11 @@
 import pgzrun, pygame, pytmx
+import numpy as np
 import pgzero.music as music
 from pgzero.loaders import sounds
-import os, time
+import os, logging
 #test
+
+logger = logging.getLogger(__name__)
 ##############################################################
 # CONSTANTS
 
@@ -11,7 +14,25 @@ HEIGHT = 240
 TITLE = "THESIS DUNGEON"
 TILE_SIZE = 16
 FRAME_RATE = 60
-MOVEMENT_COOLDOWN = 0.15  # Time between moves in seconds (adjust for feel)
+MOVEMENT_COOLDOWN = 150  # Time between moves in ms (adjust for feel)
+DEBUG_TOGGLE_COOLDOWN = 200  # Minimum ms between debug mode toggles while D is held
+ATTACK_INPUT_COOLDOWN = 100  # Minimum ms between attack inputs while SPACE is held
+# The 48x48 sword sprite is centred on the player's tile: (48-16)/2 = 16 in both
+# directions, the same whichever way the player faces
+SWORD_OFFSET = (-16, -16)
+# Animated tiles are bucketed into square sectors of this many pixels for view culling
+ANIM_SECTOR_SIZE = 16 * TILE_SIZE
+# The background is prerendered in square sections of this many pixels, only around
+# the camera, so memory doesn't grow with the map; a multiple of TILE_SIZE so tiles
+# never straddle two sections
+BG_SECTION_SIZE = 64 * TILE_SIZE
+# Pixel step for each of the four directions move_player() is called with
+MOVE_STEP_PX = {
+    (-1, 0): (-TILE_SIZE, 0),
+    (1, 0): (TILE_SIZE, 0),
+    (0, -1): (0, -TILE_SIZE),
+    (0, 1): (0, TILE_SIZE),
+}
 
 DEBUG_MODE_ON = False
 
@@ -21,87 +42,94 @@ LEVEL_SEQUENCE = [
 
 
 class AnimatedTile:
-    """Lightweight animated tile class for Tiled animations"""
+    """Lightweight animated tile class for Tiled animations, shared by every tile with its GID"""
 
-    def __init__(self, x, y, tile_gid, tmx_data):
-        self.x = x
-        self.y = y
+    def __init__(self, tile_gid, tmx_data, get_tile_image=None):
         self.tile_gid = tile_gid
         self.tmx_data = tmx_data
+        # GID -> Surface lookup, the level loader passes its cached one
+        self.get_tile_image = get_tile_image or tmx_data.get_tile_image_by_gid
+        self.positions = []  # Pixel (x, y) of every map tile using this GID
         self.current_frame = 0
-        self.last_frame_time = time.time()
+        self.last_frame_time = pygame.time.get_ticks()
 
         # Get animation data from Tiled
         self.frames = []
-        self.frame_duration = 0.5  # Default duration
+        self.frame_duration = 500  # Default duration in ms
 
         # Extract animation frames from TMX data
         self._load_animation_data()
 
+        # Precomputed frame stepping: next frame index for each frame, no modulo needed
+        self._num_frames = len(self.frames)
+        self._next = [(i + 1) % self._num_frames for i in range(self._num_frames)]
+        self._is_static = self._num_frames <= 1
+
     def _load_animation_data(self):
         """Load animation frames from TMX tile data"""
         try:
-            print(f"Loading animation data for tile GID: {self.tile_gid}")
+            logger.debug("Loading animation data for tile GID: %s", self.tile_gid)
 
             # Get tile properties directly - this is where PyTMX stores animation data
             tile_props = self.tmx_data.get_tile_properties_by_gid(self.tile_gid)
-            print(f"Tile properties: {tile_props}")
+            logger.debug("Tile properties: %s", tile_props)
 
             # Check if this tile has animation frames
             if tile_props and "frames" in tile_props:
                 animation_frames = tile_props["frames"]
-                print(f"Found {len(animation_frames)} animation frames")
+                logger.debug("Found %d animation frames", len(animation_frames))
 
                 # Extract animation frames
                 for i, frame in enumerate(animation_frames):
-                    print(
-                        f"Processing frame {i}: gid={frame.gid}, duration={frame.duration}"
+                    logger.debug(
+                        "Processing frame %d: gid=%s, duration=%s",
+                        i,
+                        frame.gid,
+                        frame.duration,
                     )
 
                     # Get the surface for this frame using the GID directly
-                    frame_surface = self.tmx_data.get_tile_image_by_gid(frame.gid)
+                    frame_surface = self.get_tile_image(frame.gid)
                     if frame_surface:
+                        # pytmx already converted it to the display format, use it as is
                         self.frames.append(frame_surface)
-                        # Use the duration from the frame (convert from ms to seconds)
-                        self.frame_duration = frame.duration / 1000.0
-                        print(f"Added frame {i}, duration: {self.frame_duration}s")
+                        # Use the duration from the frame (Tiled stores it in ms already)
+                        self.frame_duration = frame.duration
+                        logger.debug("Added frame %d, duration: %dms", i, self.frame_duration)
                     else:
-                        print(
-                            f"WARNING: Could not load frame surface for GID {frame.gid}"
+                        logger.warning(
+                            "Could not load frame surface for GID %s", frame.gid
                         )
 
                 if self.frames:
-                    print(f"Successfully loaded {len(self.frames)} animation frames")
+                    logger.debug("Successfully loaded %d animation frames", len(self.frames))
                     return
 
             # If no animation found, use the static tile
-            print("No animation frames found, using static tile")
-            static_tile = self.tmx_data.get_tile_image_by_gid(self.tile_gid)
+            logger.debug("No animation frames found, using static tile")
+            static_tile = self.get_tile_image(self.tile_gid)
             if static_tile:
                 self.frames = [static_tile]
-                print("Added static tile as single frame")
+                logger.debug("Added static tile as single frame")
             else:
-                print("ERROR: Could not load static tile!")
+                logger.error("Could not load static tile for GID %s", self.tile_gid)
 
-        except Exception as e:
-            print(f"Error loading animation for tile {self.tile_gid}: {e}")
-            import traceback
-
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error loading animation for tile %s", self.tile_gid)
             # Fallback to static tile
-            static_tile = self.tmx_data.get_tile_image_by_gid(self.tile_gid)
+            static_tile = self.get_tile_image(self.tile_gid)
             if static_tile:
                 self.frames = [static_tile]
 
-    def update(self):
-        """Update animation frame"""
-        if len(self.frames) <= 1:
-            return  # No animation needed
+    def update(self, now):
+        """Update animation frame, return the tick at which it next changes"""
+        if self._is_static:
+            return None  # No animation needed
 
-        current_time = time.time()
-        if current_time - self.last_frame_time >= self.frame_duration:
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
-            self.last_frame_time = current_time
+        if now - self.last_frame_time >= self.frame_duration:
+            self.current_frame = self._next[self.current_frame]
+            self.last_frame_time = now
+        return self.last_frame_time + self.frame_duration
 
     def get_current_frame(self):
         """Get current animation frame"""
@@ -110,10 +138,16 @@ class AnimatedTile:
         return None
 
 
-class AnimatedSprite:
+# Spritesheets already loaded, keyed by (image path, tile size) and shared by every sprite using them
+SHEET_CACHE = {}
+
+
+class SpriteSheet:
+    """Loaded spritesheet and its cached animation frames, shared between sprites"""
+
     def __init__(self, spritesheet_path, tile_size=16, animations=None):
         """
-        Initialize animated sprite
+        Load a spritesheet and cut out all animation frames
 
         Args:
             spritesheet_path: Path to the spritesheet image
@@ -121,21 +155,31 @@ class AnimatedSprite:
             animations: Dict defining animations
         """
         self.tile_size = tile_size
-        self.spritesheet = pygame.image.load(spritesheet_path)
+        # Convert once to the display format (needs the display to be set up first)
+        self.spritesheet = pygame.image.load(spritesheet_path).convert_alpha()
         self.animations = animations or {}
 
-        # Current animation state
-        self.current_animation = None
-        self.current_frame = 0
-        self.last_frame_time = 0
-        self.animation_finished = False
-
         # Cache for sprite frames to avoid repeated subsurface calls
         self.frame_cache = {}
 
         # Pre-load all frames into cache
         self._cache_frames()
 
+    @staticmethod
+    def get(spritesheet_path, tile_size=16, animations=None):
+        """Return the cached sheet for this path and tile size, loading it on first use"""
+        key = (spritesheet_path, tile_size)
+        sheet = SHEET_CACHE.get(key)
+        if sheet is None:
+            sheet = SpriteSheet(spritesheet_path, tile_size, animations)
+            SHEET_CACHE[key] = sheet
+        elif sheet.animations != (animations or {}):
+            # The frames were cut for the first caller's animations, don't hand them out
+            raise ValueError(
+                f"Spritesheet {spritesheet_path} already loaded with different animations"
+            )
+        return sheet
+
     def _cache_frames(self):
         """Pre-load all animation frames into cache for better performance"""
         for anim_name, anim_data in self.animations.items():
@@ -146,50 +190,86 @@ class AnimatedSprite:
                 frame = self.spritesheet.subsurface(
                     x, y, self.tile_size, self.tile_size
                 )
+                # Copy into a standalone surface in the display format
+                frame = frame.copy().convert_alpha()
                 self.frame_cache[anim_name].append(frame)
 
-    def play_animation(self, animation_name, reset=True):
-        """Start playing an animation"""
+
+class AnimatedSprite:
+    """Per-instance animation state playing frames from a shared SpriteSheet"""
+
+    def __init__(self, sheet):
+        """
+        Initialize animated sprite
+
+        Args:
+            sheet: SpriteSheet providing the animations and their frames
+        """
+        self.sheet = sheet
+        self.animations = sheet.animations
+        self.frame_cache = sheet.frame_cache
+
+        # Current animation state
+        self.current_animation = None
+        self.current_frame = 0
+        self.last_frame_time = 0
+        self.animation_finished = False
+        # True while update() has frames left to advance; callers check it to skip the call
+        self.is_active = False
+
+        # Active animation data, cached by play_animation for the update/draw hot path
+        self._active_frames = []
+        self._active_duration = 0
+        self._active_loop = True
+        self._active_len = 0
+
+        # Frame surface to draw, only changed when the frame index changes
+        self.current_surface = None
+
+    def play_animation(self, animation_name, reset=True, now=None):
+        """Start playing an animation (now defaults to the current pygame tick in ms)"""
         if animation_name not in self.animations:
-            print(f"Warning: Animation '{animation_name}' not found")
+            logger.warning("Animation '%s' not found", animation_name)
             return
 
         if self.current_animation != animation_name or reset:
             self.current_animation = animation_name
             self.current_frame = 0
-            self.last_frame_time = time.time()
+            self.last_frame_time = pygame.time.get_ticks() if now is None else now
             self.animation_finished = False
 
-    def update(self):
-        """Update animation frame based on time"""
-        if not self.current_animation or self.animation_finished:
-            return
+            anim_data = self.animations[animation_name]
+            self._active_frames = self.frame_cache[animation_name]
+            self._active_duration = anim_data["duration"]
+            self._active_loop = anim_data.get("loop", True)
+            self._active_len = len(self._active_frames)
+            self.current_surface = self._active_frames[0] if self._active_len else None
+            self.is_active = self._active_len > 1
 
-        current_time = time.time()
-        anim_data = self.animations[self.current_animation]
+    def update(self, now):
+        """Update animation frame based on time (callers skip this while not is_active)"""
+        if not self._active_len:
+            return  # No animation started yet, nothing to advance
 
         # Check if it's time to advance frame
-        if current_time - self.last_frame_time >= anim_data["duration"]:
+        if now - self.last_frame_time >= self._active_duration:
             self.current_frame += 1
-            self.last_frame_time = current_time
+            self.last_frame_time = now
 
             # Handle animation end
-            if self.current_frame >= len(anim_data["frames"]):
-                if anim_data.get("loop", True):
+            if self.current_frame >= self._active_len:
+                if self._active_loop:
                     self.current_frame = 0  # Loop back to start
                 else:
-                    self.current_frame = len(anim_data["frames"]) - 1
+                    self.current_frame = self._active_len - 1
                     self.animation_finished = True
+                    self.is_active = False
+
+            self.current_surface = self._active_frames[self.current_frame]
 
     def get_current_frame(self):
         """Get the current frame surface"""
-        if not self.current_animation:
-            return None
-
-        if self.current_animation in self.frame_cache:
-            return self.frame_cache[self.current_animation][self.current_frame]
-
-        return None
+        return self.current_surface
 
     def is_animation_finished(self):
         """Check if current animation is finished (for non-looping animations)"""
@@ -209,14 +289,14 @@ class Player:
         # Attack state
         self.is_attacking = False
         self.attack_start_time = 0
-        self.attack_duration = 0.5  # Total attack duration (5 frames * 100ms)
+        self.attack_duration = 500  # Total attack duration in ms (5 frames * 100ms)
 
         # Hurt state
         self.is_hurt = False
         self.hurt_start_time = 0
-        self.hurt_duration = 1.0  # 1 second of hurt state
+        self.hurt_duration = 1000  # 1 second of hurt state
         self.invincibility_duration = (
-            1.5  # 1.5 seconds of invincibility after being hurt
+            1500  # 1.5 seconds of invincibility after being hurt
         )
         self.is_invincible = False
         self.invincibility_start_time = 0
@@ -225,30 +305,33 @@ class Player:
         self.max_health = 3
         self.current_health = 3
 
-        # Snap position to grid on initialization
-        self.x = (self.x // TILE_SIZE) * TILE_SIZE
-        self.y = (self.y // TILE_SIZE) * TILE_SIZE
+        # Snap position to grid on initialization (as ints, TMX coordinates are floats)
+        self.x = int(self.x // TILE_SIZE) * TILE_SIZE
+        self.y = int(self.y // TILE_SIZE) * TILE_SIZE
+
+        # Collision rectangle, kept in sync with x/y instead of rebuilt per query
+        self._rect = pygame.Rect(self.x, self.y, TILE_SIZE, TILE_SIZE)
 
         # Define animations for the player
         player_animations = {
             "idle_right": {
                 "frames": [(0, 0), (0, 1), (0, 2)],  # Row 0, columns 0-2
-                "duration": 0.6,
+                "duration": 600,
                 "loop": True,
             },
             "idle_left": {
                 "frames": [(1, 0), (1, 1), (1, 2)],  # Row 1, columns 0-2
-                "duration": 0.6,
+                "duration": 600,
                 "loop": True,
             },
             "walk_right": {
                 "frames": [(2, 0), (2, 1), (2, 2), (2, 3)],  # Row 2, columns 0-3
-                "duration": 0.6,
+                "duration": 600,
                 "loop": True,
             },
             "walk_left": {
                 "frames": [(3, 0), (3, 1), (3, 2), (3, 3)],  # Row 3, columns 0-3
-                "duration": 0.6,
+                "duration": 600,
                 "loop": True,
             },
             "hurt_right": {
@@ -259,7 +342,7 @@ class Player:
                     (4, 4),
                     (4, 5),
                 ],  # Row 5, columns 1-5
-                "duration": 0.6,  # 200ms per frame for hurt animation
+                "duration": 600,  # 200ms per frame for hurt animation
                 "loop": False,
             },
             "hurt_left": {
@@ -270,7 +353,7 @@ class Player:
                     (5, 4),
                     (5, 5),
                 ],  # Row 6, columns 1-5
-                "duration": 0.6,  # 200ms per frame for hurt animation
+                "duration": 600,  # 200ms per frame for hurt animation
                 "loop": False,
             },
         }
@@ -285,7 +368,7 @@ class Player:
                     (0, 3),
                     (0, 4),
                 ],  # Row 0, columns 0-4
-                "duration": 0.1,  # 100ms per frame
+                "duration": 100,  # 100ms per frame
                 "loop": False,
             },
             "attack_right": {
@@ -296,36 +379,38 @@ class Player:
                     (2, 3),
                     (2, 4),
                 ],  # Row 2, columns 0-4
-                "duration": 0.1,  # 100ms per frame
+                "duration": 100,  # 100ms per frame
                 "loop": False,
             },
         }
 
         # Create animated sprites
-        self.sprite = AnimatedSprite("images/player.png", TILE_SIZE, player_animations)
+        self.sprite = AnimatedSprite(
+            SpriteSheet.get("images/player.png", TILE_SIZE, player_animations)
+        )
         self.sword_sprite = AnimatedSprite(
-            "images/weapons_animated.png", 48, sword_animations
+            SpriteSheet.get("images/weapons_animated.png", 48, sword_animations)
         )
         self.sprite.play_animation("idle_right")  # Start with idle animation
 
-    def start_attack(self):
+    def start_attack(self, now):
         """Start the attack animation if not already attacking or hurt"""
         if self.is_attacking or self.is_hurt:
             return False  # Already attacking or hurt
 
         self.is_attacking = True
-        self.attack_start_time = time.time()
+        self.attack_start_time = now
         sounds.sword_2.play()
 
         # Start appropriate sword animation based on facing direction
         if self.facing_direction == "right":
-            self.sword_sprite.play_animation("attack_right", reset=True)
+            self.sword_sprite.play_animation("attack_right", reset=True, now=now)
         else:
-            self.sword_sprite.play_animation("attack_left", reset=True)
+            self.sword_sprite.play_animation("attack_left", reset=True, now=now)
 
         return True
 
-    def take_damage(self, damage=1):
+    def take_damage(self, now, damage=1):
         """Make the player take damage if not invincible"""
         if self.is_invincible or self.is_hurt:
             return False  # Already hurt or invincible
@@ -336,23 +421,26 @@ class Player:
 
         # Start hurt state
         self.is_hurt = True
-        self.hurt_start_time = time.time()
+        self.hurt_start_time = now
 
         # Start invincibility
         self.is_invincible = True
-        self.invincibility_start_time = time.time()
+        self.invincibility_start_time = now
 
         # Cancel any current attack
         self.is_attacking = False
 
         # Start hurt animation based on facing direction
         if self.facing_direction == "right":
-            self.sprite.play_animation("hurt_right", reset=True)
+            self.sprite.play_animation("hurt_right", reset=True, now=now)
         else:
-            self.sprite.play_animation("hurt_left", reset=True)
+            self.sprite.play_animation("hurt_left", reset=True, now=now)
 
-        print(
-            f"Player took {damage} damage! Health: {self.current_health}/{self.max_health}"
+        logger.debug(
+            "Player took %d damage! Health: %d/%d",
+            damage,
+            self.current_health,
+            self.max_health,
         )
         return True
 
@@ -362,26 +450,36 @@ class Player:
 
     def get_rect(self):
         """Get the player's collision rectangle"""
-        return pygame.Rect(self.x, self.y, TILE_SIZE, TILE_SIZE)
+        return self._rect
+
+    def get_draw_rect(self, camera_x, camera_y):
+        """Get the screen area the player and sword may cover this frame"""
+        offset_x, offset_y = SWORD_OFFSET
+        sword_size = self.sword_sprite.sheet.tile_size
+        return pygame.Rect(
+            self.x - camera_x + offset_x,
+            self.y - camera_y + offset_y,
+            sword_size,
+            sword_size,
+        )
 
-    def update(self):
+    def update(self, now):
         """Update player animations and states"""
-        current_time = time.time()
-
         # Update hurt state
         if self.is_hurt:
             # Check if hurt duration has elapsed
-            if current_time - self.hurt_start_time >= self.hurt_duration:
+            if now - self.hurt_start_time >= self.hurt_duration:
                 self.is_hurt = False
             else:
                 # Update hurt animation
-                self.sprite.update()
+                if self.sprite.is_active:
+                    self.sprite.update(now)
                 return  # Don't process other states while hurt
 
         # Update invincibility state
         if self.is_invincible:
             if (
-                current_time - self.invincibility_start_time
+                now - self.invincibility_start_time
                 >= self.invincibility_duration
             ):
                 self.is_invincible = False
@@ -389,53 +487,39 @@ class Player:
         # Update attack state
         if self.is_attacking:
             # Check if attack duration has elapsed
-            if current_time - self.attack_start_time >= self.attack_duration:
+            if now - self.attack_start_time >= self.attack_duration:
                 self.is_attacking = False
             else:
                 # Update sword animation during attack
-                self.sword_sprite.update()
+                if self.sword_sprite.is_active:
+                    self.sword_sprite.update(now)
 
         # Update movement timer
         if self.is_moving:
             self.movement_timer = (
-                current_time + 0.3
+                now + 300
             )  # Keep showing walk animation for 0.3 seconds
 
         # Determine if we should show walking or idle animation
-        show_walking = current_time < self.movement_timer
+        show_walking = now < self.movement_timer
 
         # Update animation state based on movement (only if not attacking or hurt)
         if not self.is_attacking and not self.is_hurt:
             if show_walking:
-                if self.facing_direction == "right":
-                    self.sprite.play_animation("walk_right", reset=False)
-                else:
-                    self.sprite.play_animation("walk_left", reset=False)
+                wanted = "walk_right" if self.facing_direction == "right" else "walk_left"
             else:
-                if self.facing_direction == "right":
-                    self.sprite.play_animation("idle_right", reset=False)
-                else:
-                    self.sprite.play_animation("idle_left", reset=False)
+                wanted = "idle_right" if self.facing_direction == "right" else "idle_left"
+            # Only call into the sprite when the animation actually changes
+            if wanted != self.sprite.current_animation:
+                self.sprite.play_animation(wanted, now=now)
 
         # Update sprite animation
-        self.sprite.update()
+        if self.sprite.is_active:
+            self.sprite.update(now)
 
         # Reset movement flag (will be set again if moving)
         self.is_moving = False
 
-    def get_sword_offset(self):
-        """Calculate the offset for the sword sprite based on facing direction"""
-        if self.facing_direction == "right":
-            # Sword animation while facing right needs to be placed 16px to the left
-            offset_x = -16
-            offset_y = -16  # Center vertically (48-16)/2 = 16, so -16 to align
-        else:
-            # Sword animation while facing left needs to be placed 16px to the right
-            offset_x = -16
-            offset_y = -16  # Center vertically
-
-        return offset_x, offset_y
-
     def draw(self, screen, camera_x, camera_y):
         """Draw the player and sword (if attacking) relative to camera position"""
         screen_x = self.x - camera_x
@@ -445,21 +529,21 @@ class Player:
         should_draw = True
         if self.is_invincible and not self.is_hurt:
             # Flash every 0.1 seconds during invincibility
-            flash_interval = 0.1
-            time_since_invincible = time.time() - self.invincibility_start_time
-            should_draw = int(time_since_invincible / flash_interval) % 2 == 0
+            flash_interval = 100
+            time_since_invincible = pygame.time.get_ticks() - self.invincibility_start_time
+            should_draw = (time_since_invincible // flash_interval) % 2 == 0
 
         if should_draw:
             # Draw player sprite
-            current_frame = self.sprite.get_current_frame()
+            current_frame = self.sprite.current_surface
             if current_frame:
                 screen.blit(current_frame, (screen_x, screen_y))
 
         # Draw sword if attacking
         if self.is_attacking:
-            sword_frame = self.sword_sprite.get_current_frame()
+            sword_frame = self.sword_sprite.current_surface
             if sword_frame:
-                offset_x, offset_y = self.get_sword_offset()
+                offset_x, offset_y = SWORD_OFFSET
                 sword_x = screen_x + offset_x
                 sword_y = screen_y + offset_y
                 screen.blit(sword_frame, (sword_x, sword_y))
@@ -475,7 +559,9 @@ class Player:
         if not self.can_move(current_time):
             return False
 
-        if dx != 0 and dy != 0:
+        # Only the four cardinal directions have a step
+        step = MOVE_STEP_PX.get((dx, dy))
+        if step is None:
             return False
 
         # Update facing direction
@@ -485,8 +571,8 @@ class Player:
             self.facing_direction = "left"
 
         # Calculate new position
-        new_x = self.x + (dx * TILE_SIZE)
-        new_y = self.y + (dy * TILE_SIZE)
+        new_x = self.x + step[0]
+        new_y = self.y + step[1]
 
         # Boundary checking (simplified)
         moved = False
@@ -500,6 +586,8 @@ class Player:
                 moved = True
 
         if moved:
+            self._rect.x = self.x
+            self._rect.y = self.y
             self.last_move_time = current_time
             self.is_moving = True  # Set movement flag for animation
             return True
@@ -515,73 +603,87 @@ class Enemy:
         self.enemy_movement = enemy_movement
         self.blocks = blocks
 
-        # Snap position to grid on initialization
-        self.x = (self.x // TILE_SIZE) * TILE_SIZE
-        self.y = (self.y // TILE_SIZE) * TILE_SIZE
+        # Snap position to grid on initialization (as ints, TMX coordinates are floats)
+        self.x = int(self.x // TILE_SIZE) * TILE_SIZE
+        self.y = int(self.y // TILE_SIZE) * TILE_SIZE
+
+        # Collision rectangle, kept in sync with x/y instead of rebuilt per query
+        self._rect = pygame.Rect(self.x, self.y, TILE_SIZE, TILE_SIZE)
 
         # Store starting position for movement bounds
         self.start_x = self.x
         self.start_y = self.y
 
+        # Movement axis, fixed per enemy: 'horizontal' moves on x, 'vertical' on y
+        if enemy_movement == "horizontal":
+            self._axis = (1, 0)
+        elif enemy_movement == "vertical":
+            self._axis = (0, 1)
+        else:
+            self._axis = (0, 0)
+
+        # Animations per facing, as (walk, idle); for vertical movement +1 = down
+        self._anim = {1: ("walk_right", "idle_right"), -1: ("walk_left", "idle_left")}
+
         # Movement state
-        self.facing_direction = "right"  # Start facing right
+        self.facing = 1  # +1 = right/down, -1 = left/up; start facing right
         self.movement_state = "moving"  # 'moving' or 'idle'
         self.blocks_moved = 0  # How many blocks moved in current direction
         self.idle_start_time = 0
-        self.idle_duration = 3.0  # 3 seconds idle time
+        self.idle_duration = 3000  # 3 seconds idle time
         self.last_move_time = 0
-        self.move_cooldown = 0.3  # Time between moves (adjust for speed)
+        self.move_cooldown = 300  # Time between moves in ms (adjust for speed)
 
         # Define animations for the enemy rat
         enemy_animations = {
             "idle_right": {
                 "frames": [(0, 0), (0, 1)],  # Row 1, columns 1-2 (0-indexed)
-                "duration": 0.6,
+                "duration": 600,
                 "loop": True,
             },
             "idle_left": {
                 "frames": [(1, 0), (1, 1)],  # Row 2, columns 1-2 (0-indexed)
-                "duration": 0.6,
+                "duration": 600,
                 "loop": True,
             },
             "walk_right": {
                 "frames": [(2, 0), (2, 1), (2, 2)],  # Row 3, columns 1-3 (0-indexed)
-                "duration": 0.4,
+                "duration": 400,
                 "loop": True,
             },
             "walk_left": {
                 "frames": [(3, 0), (3, 1), (3, 2)],  # Row 4, columns 1-3 (0-indexed)
-                "duration": 0.4,
+                "duration": 400,
                 "loop": True,
             },
         }
 
-        # Create animated sprite
+        # Create animated sprite (all rats share one loaded sheet, each keeps its own state)
         self.sprite = AnimatedSprite(
-            "images/enemy_rat.png", TILE_SIZE, enemy_animations
+            SpriteSheet.get("images/enemy_rat.png", TILE_SIZE, enemy_animations)
         )
         self.sprite.play_animation("walk_right")  # Start walking right
 
     def get_rect(self):
         """Get the enemy's collision rectangle"""
-        return pygame.Rect(self.x, self.y, TILE_SIZE, TILE_SIZE)
+        return self._rect
 
-    def update(self, level_loader=None):
-        """Update enemy AI and animations"""
-        current_time = time.time()
+    def get_draw_rect(self, camera_x, camera_y):
+        """Get the screen area the enemy covers this frame"""
+        return pygame.Rect(self.x - camera_x, self.y - camera_y, TILE_SIZE, TILE_SIZE)
 
+    def update(self, now, level_loader=None, animate=True):
+        """Update enemy AI and animations (animate=False skips the sprite, e.g. off-screen)
+
+        Returns True if the enemy moved onto another tile this frame.
+        """
+        moved = False
         if self.movement_state == "moving":
             # Check if it's time to move
-            if current_time - self.last_move_time >= self.move_cooldown:
-                # Determine movement direction based on enemy_movement type and facing direction
-                dx, dy = 0, 0
-
-                if self.enemy_movement == "horizontal":
-                    dx = 1 if self.facing_direction == "right" else -1
-                elif self.enemy_movement == "vertical":
-                    dy = (
-                        1 if self.facing_direction == "right" else -1
-                    )  # 'right' = down, 'left' = up
+            if now - self.last_move_time >= self.move_cooldown:
+                # Determine movement direction from the movement axis and facing
+                dx = self._axis[0] * self.facing
+                dy = self._axis[1] * self.facing
 
                 # Check if movement is valid (collision detection)
                 new_x = self.x + (dx * TILE_SIZE)
@@ -595,84 +697,43 @@ class Enemy:
                     # Move the enemy
                     self.x = new_x
                     self.y = new_y
+                    self._rect.x = new_x
+                    self._rect.y = new_y
                     self.blocks_moved += 1
-                    self.last_move_time = current_time
+                    self.last_move_time = now
+                    moved = True
 
                     # Check if we've moved the required number of blocks
                     if self.blocks_moved >= self.blocks:
                         # Switch to idle state
                         self.movement_state = "idle"
-                        self.idle_start_time = current_time
+                        self.idle_start_time = now
                         self.blocks_moved = 0  # Reset block counter
-
-                        # Update animation to idle
-                        if self.enemy_movement == "horizontal":
-                            if self.facing_direction == "right":
-                                self.sprite.play_animation("idle_right")
-                            else:
-                                self.sprite.play_animation("idle_left")
-                        elif self.enemy_movement == "vertical":
-                            # For vertical movement, we use right/left animations based on direction
-                            if self.facing_direction == "right":  # Moving down
-                                self.sprite.play_animation("idle_right")
-                            else:  # Moving up
-                                self.sprite.play_animation("idle_left")
                 else:
                     # Can't move (hit wall or obstacle), immediately switch to idle and turn around
                     self.movement_state = "idle"
-                    self.idle_start_time = current_time
+                    self.idle_start_time = now
                     self.blocks_moved = 0
 
-                    # Update animation to idle
-                    if self.enemy_movement == "horizontal":
-                        if self.facing_direction == "right":
-                            self.sprite.play_animation("idle_right")
-                        else:
-                            self.sprite.play_animation("idle_left")
-                    elif self.enemy_movement == "vertical":
-                        if self.facing_direction == "right":
-                            self.sprite.play_animation("idle_right")
-                        else:
-                            self.sprite.play_animation("idle_left")
-
-            # Update walking animation
-            else:
-                if self.enemy_movement == "horizontal":
-                    if self.facing_direction == "right":
-                        self.sprite.play_animation("walk_right", reset=False)
-                    else:
-                        self.sprite.play_animation("walk_left", reset=False)
-                elif self.enemy_movement == "vertical":
-                    # For vertical movement, use right/left animations
-                    if self.facing_direction == "right":  # Moving down
-                        self.sprite.play_animation("walk_right", reset=False)
-                    else:  # Moving up
-                        self.sprite.play_animation("walk_left", reset=False)
-
         elif self.movement_state == "idle":
             # Check if idle time is over
-            if current_time - self.idle_start_time >= self.idle_duration:
+            if now - self.idle_start_time >= self.idle_duration:
                 # Switch direction and start moving again
-                self.facing_direction = (
-                    "left" if self.facing_direction == "right" else "right"
-                )
+                self.facing = -self.facing
                 self.movement_state = "moving"
-                self.last_move_time = current_time  # Reset move timer
+                self.last_move_time = now  # Reset move timer
 
-                # Update animation to walking
-                if self.enemy_movement == "horizontal":
-                    if self.facing_direction == "right":
-                        self.sprite.play_animation("walk_right")
-                    else:
-                        self.sprite.play_animation("walk_left")
-                elif self.enemy_movement == "vertical":
-                    if self.facing_direction == "right":  # Moving down
-                        self.sprite.play_animation("walk_right")
-                    else:  # Moving up
-                        self.sprite.play_animation("walk_left")
+        # Pick the animation for the current state, only (re)starting it on change
+        walk_anim, idle_anim = self._anim[self.facing]
+        wanted = walk_anim if self.movement_state == "moving" else idle_anim
+        if wanted != self.sprite.current_animation:
+            self.sprite.play_animation(wanted, now=now)
+
+        # Update sprite animation only while it can be seen
+        if animate and self.sprite.is_active:
+            self.sprite.update(now)
 
-        # Always update sprite animation
-        self.sprite.update()
+        return moved
 
     def draw(self, screen, camera_x, camera_y):
         """Draw the enemy relative to camera position"""
@@ -680,7 +741,7 @@ class Enemy:
         screen_y = self.y - camera_y
 
         # Draw enemy sprite
-        current_frame = self.sprite.get_current_frame()
+        current_frame = self.sprite.current_surface
         if current_frame:
             screen.blit(current_frame, (screen_x, screen_y))
 
@@ -689,7 +750,7 @@ def toggle_debug_mode():
     """Toggle debug mode on/off"""
     global DEBUG_MODE_ON
     DEBUG_MODE_ON = not DEBUG_MODE_ON
-    print(f"Debug mode: {'ON' if DEBUG_MODE_ON else 'OFF'}")
+    logger.info("Debug mode: %s", "ON" if DEBUG_MODE_ON else "OFF")
 
 
 ##############################################################
@@ -701,10 +762,14 @@ class UI:
 
     def __init__(self):
         # Load UI spritesheet
-        self.ui_spritesheet = pygame.image.load("images/ui_hud.png")
+        self.ui_spritesheet = pygame.image.load("images/ui_hud.png").convert_alpha()
 
         # Extract heart sprites (assuming 16x16 tiles)
-        self.full_heart = self.ui_spritesheet.subsurface(0, 0, TILE_SIZE, TILE_SIZE)
+        self.full_heart = (
+            self.ui_spritesheet.subsurface(0, 0, TILE_SIZE, TILE_SIZE)
+            .copy()
+            .convert_alpha()
+        )
         # If you have empty heart in column 2, row 1:
         # self.empty_heart = self.ui_spritesheet.subsurface(TILE_SIZE, 0, TILE_SIZE, TILE_SIZE)
 
@@ -713,6 +778,15 @@ class UI:
         self.heart_start_y = 16
         self.heart_spacing = TILE_SIZE  # Hearts are placed side by side
 
+    def get_draw_rect(self, player):
+        """Get the screen area covered by the hearts row"""
+        return pygame.Rect(
+            self.heart_start_x,
+            self.heart_start_y,
+            player.max_health * self.heart_spacing,
+            TILE_SIZE,
+        )
+
     def draw(self, screen, player):
         """Draw the UI elements (hearts) on screen"""
         for i in range(player.max_health):
@@ -736,37 +810,88 @@ class LevelLoader:
         self.level_sequence = level_sequence
         self.current_level_index = 0
         self.tmx_data = None
-        self.bg_surface = None
+        self.bg_sections = {}  # (section_x, section_y) -> prerendered background Surface
+        self._bg_layers = []  # Tile layers prerendered into bg_sections, bottom first
+        self._animated_gids = set()  # GIDs left out of bg_sections, drawn each frame
         self.camera_x = 0  # Camera stays at 0,0 for stationary view
         self.camera_y = 0
+        self._level_w_px = 0  # Level size in pixels, cached at load for move_player
+        self._level_h_px = 0
+        self.current_time = 0  # Tick (ms) of the frame being updated, set by update()
+        # Camera view padded by one tile, used to cull off-screen entities
+        self.view_rect = pygame.Rect(
+            -TILE_SIZE, -TILE_SIZE, WIDTH + 2 * TILE_SIZE, HEIGHT + 2 * TILE_SIZE
+        )
         self.entities = []  # List to hold all entities
+        self.enemies = []  # Subset of entities that are enemies
+        self._entity_cells = {}  # (tile_x, tile_y) -> enemies standing on that tile
+        self._cell_by_entity = {}  # Enemy -> (tile_x, tile_y) it is filed under
+        self._other_updatables = []  # Non-enemy entities with an update() method
+        self._drawables = []  # Entities with a draw() method, in map order
         self.player = None  # Reference to the player object
-        self.collision_grid = []  # 2D array for collision detection
-        self.animated_tiles = []  # List of animated tiles
+        self._set_collision_grid(np.zeros((0, 0), dtype=bool))
+        self.animated_gid_groups = {}  # Animated tiles by GID, advanced once per GID
+        self._anim_sectors = {}  # (sector_x, sector_y) -> [(pixel_x, pixel_y, AnimatedTile)]
+        self._next_anim_tick = 0  # Earliest tick at which any animated tile changes frame
+        self._gid_cache = {}  # Tile images by GID for the current map
+        self._layers_by_name = {}  # TMX layers of the current map by name, first one wins
+        self._tile_layers_by_name = {}  # Same, but only layers with tile data
         self.ui = UI()  # Create UI system
+        # Entity constructors by lowercased TMX object name, see _load_entities
+        self._entity_factories = {
+            "player": self._make_player,
+            "enemy": self._make_enemy,
+            "info": self._handle_info,
+        }
+
+        # Semi-transparent debug overlays, created once and reused for every tile
+        self._red_overlay = pygame.Surface((TILE_SIZE, TILE_SIZE))
+        self._red_overlay.set_alpha(128)
+        self._red_overlay.fill((255, 0, 0))
+        self._blue_overlay = pygame.Surface((TILE_SIZE, TILE_SIZE))
+        self._blue_overlay.set_alpha(128)
+        self._blue_overlay.fill((0, 0, 255))
+
+        # Dirty-rect rendering state: screen areas drawn over last frame, restored
+        # from bg_sections on the next one instead of repainting the whole screen
+        self.dirty_rects = []
+        self._full_redraw = True
+        self._debug_drawn = False
+        self._drawn_camera = None
+
+        # Input cooldowns: tick (ms) at which each held key is accepted again
+        self._debug_cooldown = 0
+        self._attack_cooldown = 0
 
         # Load the first level
         self.load_current_level()
 
-    def check_player_enemy_collisions(self):
+    def check_player_enemy_collisions(self, now):
         """Check for collisions between player and enemies"""
         if not self.player or self.player.is_invincible:
             return
 
-        player_rect = self.player.get_rect()
-
-        for entity in self.entities:
-            if isinstance(entity, Enemy):
-                enemy_rect = entity.get_rect()
-                if player_rect.colliderect(enemy_rect):
-                    # Player collided with enemy
-                    if self.player.take_damage(1):
-                        print("Player hit by enemy!")
-                        # Check if player is dead
-                        if self.player.is_dead():
-                            print("Game Over!")
-                            # You can add game over logic here
-                    break  # Only process one collision per frame
+        # Player and enemies are tile-sized, so overlap is a plain integer AABB test
+        px = self.player.x
+        py = self.player.y
+
+        # Anything overlapping the player stands on one of the 3x3 tiles around it
+        cell_x = px // TILE_SIZE
+        cell_y = py // TILE_SIZE
+        entity_cells = self._entity_cells
+
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                for enemy in entity_cells.get((cell_x + dx, cell_y + dy), ()):
+                    if abs(enemy.x - px) < TILE_SIZE and abs(enemy.y - py) < TILE_SIZE:
+                        # Player collided with enemy
+                        if self.player.take_damage(now, 1):
+                            logger.debug("Player hit by enemy!")
+                            # Check if player is dead
+                            if self.player.is_dead():
+                                logger.info("Game Over!")
+                                # You can add game over logic here
+                        return  # Only process one collision per frame
 
     def load_current_level(self):
         """Load the current level from the sequence"""
@@ -778,15 +903,32 @@ class LevelLoader:
 
         try:
             self.tmx_data = pytmx.load_pygame(tmx_path)
+            self._gid_cache = {}  # GIDs are per map, start a fresh image cache
+            self._index_layers()
+            self.animated_gid_groups = {}  # Filled by _render_background and _load_animated_tiles
+            self._anim_sectors = {}
+            self._next_anim_tick = 0
             self._create_collision_grid()  # Create collision grid first
+            self._level_w_px, self._level_h_px = self.get_level_size()
             self._render_background()
             self._load_entities()
             self._load_animated_tiles()  # Load animated tiles
+            self._full_redraw = True  # New level, repaint everything once
             return True
         except Exception as e:
-            print(f"Error loading level {level_name}: {e}")
+            logger.error("Error loading level %s: %s", level_name, e)
             return False
 
+    def _index_layers(self):
+        """Index the map's layers by name, keeping the first layer of each name"""
+        self._layers_by_name = {}
+        self._tile_layers_by_name = {}
+        for layer in self.tmx_data.layers:
+            self._layers_by_name.setdefault(layer.name, layer)
+            # Object groups can share a name with a tile layer, never let them hide it
+            if hasattr(layer, "data"):
+                self._tile_layers_by_name.setdefault(layer.name, layer)
+
     def _create_collision_grid(self):
         """Create a 2D collision grid from the colliders layer"""
         if not self.tmx_data:
@@ -795,41 +937,58 @@ class LevelLoader:
         # Initialize collision grid with False (no collision)
         grid_width = self.tmx_data.width
         grid_height = self.tmx_data.height
-        self.collision_grid = [
-            [False for _ in range(grid_width)] for _ in range(grid_height)
-        ]
+        self._set_collision_grid(np.zeros((grid_height, grid_width), dtype=bool))
 
         # Find the colliders layer
-        colliders_layer = None
-        for tmx_layer in self.tmx_data.layers:
-            if tmx_layer.name == "colliders" and hasattr(tmx_layer, "data"):
-                colliders_layer = tmx_layer
-                break
-
-        if not colliders_layer:
-            print("Warning: 'colliders' layer not found in TMX file")
+        colliders_layer = self._tile_layers_by_name.get("colliders")
+        if colliders_layer is None:
+            logger.warning("'colliders' layer not found in TMX file")
             return
 
-        # Mark collision tiles as True
-        for x, y, gid in colliders_layer:
-            if gid:  # If there's a tile (gid > 0), it's a collision tile
-                if 0 <= y < grid_height and 0 <= x < grid_width:
-                    self.collision_grid[y][x] = True
+        # Any tile in the layer (gid > 0) is a collision tile, compared in one vectorized pass
+        self._set_collision_grid(np.asarray(colliders_layer.data, dtype=np.int32) != 0)
 
-        print(f"Created collision grid: {grid_width}x{grid_height}")
+        logger.debug("Created collision grid: %dx%d", grid_width, grid_height)
+
+    def _set_collision_grid(self, grid):
+        """Install a collision grid along with its cached size and packed bit rows"""
+        self.collision_grid = grid  # Blocked tiles as bools, indexed [y, x]
+        self._gh, self._gw = grid.shape  # Grid size cached for bounds checks
+        # Same grid packed 8 tiles per byte (first tile in the high bit) for row scans
+        self._collision_bits = np.packbits(grid, axis=1)
+
+    def any_blocked_in_row(self, tile_y, x0, x1):
+        """Check if any tile in row tile_y from x0 up to (not including) x1 is blocked"""
+        if x0 >= x1:
+            return False
+        if x0 < 0 or tile_y < 0 or x1 > self._gw or tile_y >= self._gh:
+            return True  # Out of bounds = blocked
+
+        row = self._collision_bits[tile_y]
+        first_byte = x0 >> 3
+        last_byte = (x1 - 1) >> 3
+        # Keep only the bits of the requested tiles in the first and last bytes
+        first_mask = 0xFF >> (x0 & 7)
+        last_mask = (0xFF << (7 - ((x1 - 1) & 7))) & 0xFF
+
+        if first_byte == last_byte:
+            return bool(row[first_byte] & first_mask & last_mask)
+        return bool(
+            row[first_byte] & first_mask
+            or row[last_byte] & last_mask
+            or row[first_byte + 1 : last_byte].any()
+        )
 
     def is_tile_blocked(self, tile_x, tile_y):
-        """Check if a specific tile coordinate is blocked"""
-        # Boundary check
-        if (
+        """Check if a specific tile coordinate is blocked (out of bounds = blocked)"""
+        # Bounds are checked first, numpy would silently wrap negative indices
+        return (
             tile_x < 0
             or tile_y < 0
-            or tile_y >= len(self.collision_grid)
-            or tile_x >= len(self.collision_grid[0])
-        ):
-            return True  # Out of bounds = blocked
-
-        return self.collision_grid[tile_y][tile_x]
+            or tile_x >= self._gw
+            or tile_y >= self._gh
+            or self.collision_grid[tile_y, tile_x]
+        )
 
     def is_position_blocked(self, pixel_x, pixel_y):
         """Check if a pixel position is blocked (converts to tile coordinates)"""
@@ -838,105 +997,223 @@ class LevelLoader:
         return self.is_tile_blocked(tile_x, tile_y)
 
     def _render_background(self):
-        """Pre-render the background and collision layers to a surface for better performance"""
+        """Prepare the background and collision layers for prerendering by section"""
+        self.bg_sections = {}
+        self._bg_layers = []
+        self._animated_gids = set()
         if not self.tmx_data:
             return
 
-        # Create surface for the entire level
-        level_width = self.tmx_data.width * self.tmx_data.tilewidth
-        level_height = self.tmx_data.height * self.tmx_data.tileheight
-        self.bg_surface = pygame.Surface((level_width, level_height))
-
         # Render layers in order: background layer first, then colliders layer on top
         # Note: We don't render animated layer here since it needs to be updated each frame
+        # Any animated tile found in these layers is handed to animated_gid_groups instead,
+        # so bg_sections only ever hold static tiles
         layer_names = ["background", "colliders"]
 
+        tile_width = self.tmx_data.tilewidth
+        tile_height = self.tmx_data.tileheight
+
         for layer_name in layer_names:
-            layer = None
-            for tmx_layer in self.tmx_data.layers:
-                if tmx_layer.name == layer_name and hasattr(tmx_layer, "data"):
-                    layer = tmx_layer
-                    break
-
-            if not layer:
-                print(f"Warning: '{layer_name}' not found in TMX file")
+            layer = self._tile_layers_by_name.get(layer_name)
+            if layer is None:
+                logger.warning("'%s' not found in TMX file", layer_name)
+                continue
+            self._bg_layers.append(layer)
+
+            # GIDs repeat a lot across a layer, so check each distinct one for animation once
+            gids = np.asarray(layer.data, dtype=np.int32)
+            animated = []
+            for gid in np.unique(gids).tolist():
+                if gid:
+                    tile_props = self.tmx_data.get_tile_properties_by_gid(gid)
+                    if tile_props and "frames" in tile_props:
+                        animated.append(gid)
+            if not animated:
                 continue
+            self._animated_gids.update(animated)
+
+            # Row-major, the same order the layer iterator visits them in
+            ys, xs = np.nonzero(np.isin(gids, animated))
+            for x, y, gid in zip(xs.tolist(), ys.tolist(), gids[ys, xs].tolist()):
+                self._add_animated_tile(x * tile_width, y * tile_height, gid)
+
+    def _bg_section(self, section_x, section_y):
+        """Get a background section, prerendering it the first time it is needed"""
+        section = self.bg_sections.get((section_x, section_y))
+        if section is not None:
+            return section
+
+        # Sections on the last row and column are trimmed to the level edge
+        origin_x = section_x * BG_SECTION_SIZE
+        origin_y = section_y * BG_SECTION_SIZE
+        section_w = min(BG_SECTION_SIZE, self._level_w_px - origin_x)
+        section_h = min(BG_SECTION_SIZE, self._level_h_px - origin_y)
+        section = pygame.Surface((section_w, section_h)).convert()
+
+        # Tiles under this section, BG_SECTION_SIZE is a multiple of the tile size
+        tile_width = self.tmx_data.tilewidth
+        tile_height = self.tmx_data.tileheight
+        tile_x0 = origin_x // tile_width
+        tile_y0 = origin_y // tile_height
+        tile_x1 = (origin_x + section_w) // tile_width
+        tile_y1 = (origin_y + section_h) // tile_height
+        animated_gids = self._animated_gids
+
+        # Render each layer's tiles in this section in a single blits() call
+        for layer in self._bg_layers:
+            blit_list = []
+            for y in range(tile_y0, tile_y1):
+                row = layer.data[y]
+                for x in range(tile_x0, tile_x1):
+                    gid = row[x]
+                    if gid and gid not in animated_gids:  # Only static tiles (gid > 0)
+                        tile = self._tile(gid)
+                        if tile:
+                            blit_list.append(
+                                (tile, (x * tile_width - origin_x, y * tile_height - origin_y))
+                            )
+            section.blits(blit_list, doreturn=False)
+
+        self.bg_sections[(section_x, section_y)] = section
+        return section
+
+    def _evict_bg_sections(self):
+        """Drop prerendered sections more than one section away from the camera view"""
+        section_x0 = self.camera_x // BG_SECTION_SIZE - 1
+        section_y0 = self.camera_y // BG_SECTION_SIZE - 1
+        section_x1 = (self.camera_x + WIDTH - 1) // BG_SECTION_SIZE + 1
+        section_y1 = (self.camera_y + HEIGHT - 1) // BG_SECTION_SIZE + 1
+        for key in [
+            key
+            for key in self.bg_sections
+            if not (section_x0 <= key[0] <= section_x1 and section_y0 <= key[1] <= section_y1)
+        ]:
+            del self.bg_sections[key]
+
+    def _blit_background(self, screen, x, y, w, h):
+        """Blit the level area (x, y, w, h) from the background sections it overlaps"""
+        camera_x = self.camera_x
+        camera_y = self.camera_y
+
+        # Clamp the area to the level, there are no sections outside it
+        left_edge = max(x, 0)
+        top_edge = max(y, 0)
+        right_edge = min(x + w, self._level_w_px)
+        bottom_edge = min(y + h, self._level_h_px)
+        if right_edge <= left_edge or bottom_edge <= top_edge:
+            return
 
-            # Render all tiles from this layer
-            for x, y, gid in layer:
-                if gid:  # Only render if there's a tile (gid > 0)
-                    tile = self.tmx_data.get_tile_image_by_gid(gid)
-                    if tile:
-                        self.bg_surface.blit(
-                            tile,
-                            (x * self.tmx_data.tilewidth, y * self.tmx_data.tileheight),
-                        )
+        for section_y in range(top_edge // BG_SECTION_SIZE, (bottom_edge - 1) // BG_SECTION_SIZE + 1):
+            for section_x in range(left_edge // BG_SECTION_SIZE, (right_edge - 1) // BG_SECTION_SIZE + 1):
+                section = self._bg_section(section_x, section_y)
+
+                # Clip the area to this section
+                origin_x = section_x * BG_SECTION_SIZE
+                origin_y = section_y * BG_SECTION_SIZE
+                left = max(left_edge, origin_x)
+                top = max(top_edge, origin_y)
+                right = min(right_edge, origin_x + BG_SECTION_SIZE)
+                bottom = min(bottom_edge, origin_y + BG_SECTION_SIZE)
+                screen.blit(
+                    section,
+                    (left - camera_x, top - camera_y),
+                    (left - origin_x, top - origin_y, right - left, bottom - top),
+                )
 
     def _load_entities(self):
         """Load entities from the object layer (updated to include enemies and music info)"""
         self.entities = []  # Clear existing entities
+        self.enemies = []
+        self._entity_cells = {}
+        self._cell_by_entity = {}
+        self._other_updatables = []
+        self._drawables = []
         self.player = None  # Reset player reference
 
         if not self.tmx_data:
             return
 
         # Find the entities object layer
-        entities_layer = None
-        for layer in self.tmx_data.layers:
-            if layer.name == "entities":
-                entities_layer = layer
-                break
-
-        if not entities_layer:
-            print("Warning: 'entities' layer not found in TMX file")
+        entities_layer = self._layers_by_name.get("entities")
+        if entities_layer is None:
+            logger.warning("'entities' layer not found in TMX file")
             return
 
         # Create entity objects based on their names
+        factories = self._entity_factories
         for obj in entities_layer:
             entity_name = obj.name.lower() if obj.name else ""
-
-            if entity_name == "player":
-                player = Player(obj.x, obj.y)
-                self.entities.append(player)
-                self.player = player  # Keep reference to player
-                print(f"Created Player at ({obj.x}, {obj.y})")
-
-            elif entity_name == "enemy":
-                # Extract custom properties with defaults
-                enemy_type = getattr(obj, "enemy_type", "rat")
-                enemy_movement = getattr(obj, "enemy_movement", "horizontal")
-                blocks = getattr(obj, "blocks", 2)
-
-                # Try alternative property access methods if direct access fails
-                if not hasattr(obj, "enemy_type") and hasattr(obj, "properties"):
-                    enemy_type = obj.properties.get("enemy_type", "rat")
-                    enemy_movement = obj.properties.get("enemy_movement", "horizontal")
-                    blocks = obj.properties.get("blocks", 2)
-
-                enemy = Enemy(obj.x, obj.y, enemy_type, enemy_movement, int(blocks))
-                self.entities.append(enemy)
-                print(
-                    f"Created Enemy at ({obj.x}, {obj.y}) - Type: {enemy_type}, Movement: {enemy_movement}, Blocks: {blocks}"
-                )
-
-            elif entity_name == "info":
-                # Handle info object for level settings like music
-                music_file = None
-
-                # Try to get music property using different methods
-                if hasattr(obj, "music"):
-                    music_file = obj.music
-                elif hasattr(obj, "properties") and "music" in obj.properties:
-                    music_file = obj.properties["music"]
-
-                if music_file:
-                    self._load_level_music(music_file)
-                    print(f"Found music setting: {music_file}")
-                else:
-                    print("Info object found but no music property detected")
-
+            factory = factories.get(entity_name)
+            if factory:
+                factory(obj, self._obj_props(obj))
             else:
-                print(f"Unknown entity type: {entity_name}")
+                logger.warning("Unknown entity type: %s", entity_name)
+
+    @staticmethod
+    def _obj_props(obj):
+        """Get a TMX object's custom properties as a plain dict"""
+        # pytmx serves custom properties as attributes too, from this same dict
+        properties = getattr(obj, "properties", None)
+        return dict(properties) if properties else {}
+
+    def _make_player(self, obj, props):
+        """Create the player from a 'player' object"""
+        player = Player(obj.x, obj.y)
+        self._add_entity(player)
+        self.player = player  # Keep reference to player
+        logger.debug("Created Player at (%s, %s)", obj.x, obj.y)
+
+    def _make_enemy(self, obj, props):
+        """Create an enemy from an 'enemy' object, using defaults for missing properties"""
+        enemy_type = props.get("enemy_type", "rat")
+        enemy_movement = props.get("enemy_movement", "horizontal")
+        blocks = props.get("blocks", 2)
+
+        enemy = Enemy(obj.x, obj.y, enemy_type, enemy_movement, int(blocks))
+        self._add_entity(enemy)
+        logger.debug(
+            "Created Enemy at (%s, %s) - Type: %s, Movement: %s, Blocks: %s",
+            obj.x,
+            obj.y,
+            enemy_type,
+            enemy_movement,
+            blocks,
+        )
+
+    def _handle_info(self, obj, props):
+        """Apply level settings like music from an 'info' object"""
+        music_file = props.get("music")
+        if music_file:
+            self._load_level_music(music_file)
+            logger.debug("Found music setting: %s", music_file)
+        else:
+            logger.debug("Info object found but no music property detected")
+
+    def _add_entity(self, entity):
+        """Add an entity, sorting it once into the lists update() and draw() iterate"""
+        self.entities.append(entity)
+        if isinstance(entity, Enemy):
+            self.enemies.append(entity)
+            self._register_entity_cell(entity)
+        elif hasattr(entity, "update"):
+            self._other_updatables.append(entity)
+        if hasattr(entity, "draw"):
+            self._drawables.append(entity)
+
+    def _register_entity_cell(self, entity):
+        """Add an entity to the spatial hash under the tile it stands on"""
+        cell = (entity.x // TILE_SIZE, entity.y // TILE_SIZE)
+        self._cell_by_entity[entity] = cell
+        self._entity_cells.setdefault(cell, []).append(entity)
+
+    def _unregister_entity_cell(self, entity):
+        """Remove an entity from the spatial hash cell it was registered under"""
+        cell = self._cell_by_entity.pop(entity, None)
+        bucket = self._entity_cells.get(cell)
+        if bucket:
+            bucket.remove(entity)
+            if not bucket:
+                del self._entity_cells[cell]
 
     def _load_level_music(self, music_filename):
         """Load and play background music for the level"""
@@ -951,123 +1228,199 @@ class LevelLoader:
             if os.path.exists(music_path):
                 # Play the music on loop (-1 means infinite loop)
                 music.play(music_filename)  # pgzero.music expects just the filename without extension and path
-                print(f"Playing music: {music_path}")
+                logger.info("Playing music: %s", music_path)
             else:
-                print(f"Warning: Music file not found: {music_path}")
+                logger.warning("Music file not found: %s", music_path)
 
         except Exception as e:
-            print(f"Error loading music '{music_filename}': {e}")
+            logger.error("Error loading music '%s': %s", music_filename, e)
 
     def _load_animated_tiles(self):
         """Load animated tiles from the animated layer"""
-        self.animated_tiles = []
-
         if not self.tmx_data:
             return
 
         # Find the animated layer
-        animated_layer = None
-        for layer in self.tmx_data.layers:
-            if layer.name == "animated" and hasattr(layer, "data"):
-                animated_layer = layer
-                break
-
-        if not animated_layer:
-            print("Warning: 'animated' layer not found in TMX file")
+        animated_layer = self._tile_layers_by_name.get("animated")
+        if animated_layer is None:
+            logger.warning("'animated' layer not found in TMX file")
             return
 
-        # Create animated tile objects
-        for x, y, gid in animated_layer:
-            if gid:  # Only process if there's a tile (gid > 0)
-                pixel_x = x * self.tmx_data.tilewidth
-                pixel_y = y * self.tmx_data.tileheight
-                animated_tile = AnimatedTile(pixel_x, pixel_y, gid, self.tmx_data)
-                self.animated_tiles.append(animated_tile)
+        # Find the occupied cells in one NumPy scan (row-major, same order as the
+        # layer iterator) and only visit those, the layer is mostly empty
+        gids = np.asarray(animated_layer.data, dtype=np.int32)
+        ys, xs = np.nonzero(gids)
+        tile_width = self.tmx_data.tilewidth
+        tile_height = self.tmx_data.tileheight
+        for x, y, gid in zip(xs.tolist(), ys.tolist(), gids[ys, xs].tolist()):
+            self._add_animated_tile(x * tile_width, y * tile_height, gid)
+
+        tile_count = sum(len(tile.positions) for tile in self.animated_gid_groups.values())
+        logger.debug(
+            "Loaded %d animated tiles (%d distinct)", tile_count, len(self.animated_gid_groups)
+        )
+
+    def _tile(self, gid):
+        """Get the tile image for a GID, looking it up in pytmx only the first time"""
+        img = self._gid_cache.get(gid)
+        if img is None:
+            img = self.tmx_data.get_tile_image_by_gid(gid)
+            self._gid_cache[gid] = img
+        return img
+
+    def _add_animated_tile(self, pixel_x, pixel_y, gid):
+        """Place an animated tile, sharing one AnimatedTile between all tiles of a GID"""
+        animated_tile = self.animated_gid_groups.get(gid)
+        if animated_tile is None:
+            animated_tile = AnimatedTile(gid, self.tmx_data, self._tile)
+            self.animated_gid_groups[gid] = animated_tile
+        animated_tile.positions.append((pixel_x, pixel_y))
+
+        sector = (pixel_x // ANIM_SECTOR_SIZE, pixel_y // ANIM_SECTOR_SIZE)
+        self._anim_sectors.setdefault(sector, []).append((pixel_x, pixel_y, animated_tile))
+
+    def _visible_tile_range(self):
+        """Get the (x0, y0, x1, y1) tile window covering the camera view, end exclusive"""
+        return (
+            max(self.camera_x // TILE_SIZE, 0),
+            max(self.camera_y // TILE_SIZE, 0),
+            (self.camera_x + WIDTH) // TILE_SIZE + 1,
+            (self.camera_y + HEIGHT) // TILE_SIZE + 1,
+        )
 
-        print(f"Loaded {len(self.animated_tiles)} animated tiles")
+    def _visible_animated_tiles(self):
+        """Yield (pixel_x, pixel_y, AnimatedTile) from the sectors overlapping the view"""
+        sector_x0 = (self.camera_x - TILE_SIZE) // ANIM_SECTOR_SIZE
+        sector_y0 = (self.camera_y - TILE_SIZE) // ANIM_SECTOR_SIZE
+        sector_x1 = (self.camera_x + WIDTH) // ANIM_SECTOR_SIZE
+        sector_y1 = (self.camera_y + HEIGHT) // ANIM_SECTOR_SIZE
+        for sector_y in range(sector_y0, sector_y1 + 1):
+            for sector_x in range(sector_x0, sector_x1 + 1):
+                yield from self._anim_sectors.get((sector_x, sector_y), ())
 
     def draw_debug_collision(self, screen):
         """Draw collision grid as red rectangles and animated tiles as blue rectangles (debug only)"""
         if not DEBUG_MODE_ON:
             return
 
-        # Draw collision tiles in red
-        if self.collision_grid:
-            # Create a semi-transparent red surface for collision tiles
-            for y in range(len(self.collision_grid)):
-                for x in range(len(self.collision_grid[y])):
-                    if self.collision_grid[y][x]:  # If this tile is a collision tile
-                        # Calculate screen position (accounting for camera)
-                        screen_x = (x * TILE_SIZE) - self.camera_x
-                        screen_y = (y * TILE_SIZE) - self.camera_y
-
-                        # Only draw if on screen (basic culling)
-                        if (
-                            -TILE_SIZE <= screen_x <= WIDTH
-                            and -TILE_SIZE <= screen_y <= HEIGHT
-                        ):
-                            # Draw red rectangle with some transparency
-                            red_surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
-                            red_surface.set_alpha(128)  # Semi-transparent
-                            red_surface.fill((255, 0, 0))  # Red color
-                            screen.blit(red_surface, (screen_x, screen_y))
+        overlays = []
+
+        # Draw collision tiles in red, visiting only the blocked cells in view
+        x0, y0, x1, y1 = self._visible_tile_range()
+        for y, x in np.argwhere(self.collision_grid[y0:y1, x0:x1]).tolist():
+            # Calculate screen position (accounting for camera and window offset)
+            screen_x = ((x + x0) * TILE_SIZE) - self.camera_x
+            screen_y = ((y + y0) * TILE_SIZE) - self.camera_y
+            overlays.append((self._red_overlay, (screen_x, screen_y)))
 
         # Draw animated tiles in blue
-        for tile in self.animated_tiles:
+        for tile_x, tile_y, tile in self._visible_animated_tiles():
             # Calculate screen position (accounting for camera)
-            screen_x = tile.x - self.camera_x
-            screen_y = tile.y - self.camera_y
+            screen_x = tile_x - self.camera_x
+            screen_y = tile_y - self.camera_y
 
-            # Only draw if on screen (basic culling for performance)
+            # Only draw if on screen (sectors are larger than the view)
             if -TILE_SIZE <= screen_x <= WIDTH and -TILE_SIZE <= screen_y <= HEIGHT:
-                # Draw blue rectangle with some transparency
-                blue_surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
-                blue_surface.set_alpha(128)  # Semi-transparent
-                blue_surface.fill((0, 0, 255))  # Blue color
-                screen.blit(blue_surface, (screen_x, screen_y))
+                overlays.append((self._blue_overlay, (screen_x, screen_y)))
 
-    def update(self):
+        # Hand all overlays to SDL in one call
+        if overlays:
+            screen.blits(overlays, doreturn=False)
+
+    def update(self, now):
         """Update animated tiles, entities, and check collisions"""
-        # Update animated tiles
-        for tile in self.animated_tiles:
-            tile.update()
-
-        # Update all entities
-        for entity in self.entities:
-            if hasattr(entity, 'update'):
-                # Pass level_loader reference to enemies for collision detection
-                if isinstance(entity, Enemy):
-                    entity.update(level_loader=self)
-                else:
-                    entity.update()
+        # Keep this frame's tick for input handling that runs after update()
+        self.current_time = now
+
+        # Update animated tiles (once per distinct GID, not per placed tile)
+        # Frames last hundreds of ms, so most ticks skip the loop entirely
+        if now >= self._next_anim_tick:
+            next_tick = None
+            for tile in self.animated_gid_groups.values():
+                due = tile.update(now)
+                if due is not None and (next_tick is None or due < next_tick):
+                    next_tick = due
+            # Nothing animates: park the check until the next level load resets it
+            self._next_anim_tick = next_tick if next_tick is not None else float("inf")
+
+        # Follow the camera so culling matches what draw() will show
+        view_rect = self.view_rect
+        view_rect.topleft = (self.camera_x - TILE_SIZE, self.camera_y - TILE_SIZE)
+
+        # Update all entities, from lists partitioned at load time
+        # Pass level_loader reference to enemies for collision detection
+        # Off-screen enemies keep moving but skip their sprite animation
+        for enemy in self.enemies:
+            moved = enemy.update(
+                now,
+                level_loader=self,
+                animate=view_rect.collidepoint(enemy.x, enemy.y),
+            )
+            # Keep the spatial hash in step, only enemies that stepped need refiling
+            if moved:
+                self._unregister_entity_cell(enemy)
+                self._register_entity_cell(enemy)
+        for entity in self._other_updatables:
+            entity.update(now)
 
         # Check for player-enemy collisions
-        self.check_player_enemy_collisions()
+        self.check_player_enemy_collisions(now)
 
     def draw(self, screen):
         """Draw the current level's background layer, animated tiles, and entities"""
-        if self.bg_surface:
-            # Draw the background from the stationary camera position (0,0)
-            screen_rect = pygame.Rect(self.camera_x, self.camera_y, WIDTH, HEIGHT)
-            screen.blit(self.bg_surface, (0, 0), screen_rect)
+        # Repaint everything on level load, camera moves and while the debug overlay
+        # is (or just was) on; otherwise only restore what was drawn over last frame
+        camera = (self.camera_x, self.camera_y)
+        full_redraw = (
+            self._full_redraw
+            or DEBUG_MODE_ON
+            or self._debug_drawn
+            or camera != self._drawn_camera
+        )
+        if camera != self._drawn_camera:
+            self._evict_bg_sections()  # Only keep sections near the new view
+        self._full_redraw = False
+        self._debug_drawn = DEBUG_MODE_ON
+        self._drawn_camera = camera
+
+        if full_redraw:
+            screen.fill((0, 0, 0))
+            # Draw the background sections under the camera view
+            self._blit_background(screen, self.camera_x, self.camera_y, WIDTH, HEIGHT)
+        else:
+            camera_x, camera_y = camera
+            for rect in self.dirty_rects:
+                self._blit_background(screen, rect.x + camera_x, rect.y + camera_y, rect.w, rect.h)
+
+        dirty_rects = []
 
-        # Draw animated tiles
-        for tile in self.animated_tiles:
+        # Draw animated tiles from the sectors in view, each using its GID's shared
+        # current frame, and hand them to SDL in a single blits() call
+        blit_sequence = []
+        for tile_x, tile_y, tile in self._visible_animated_tiles():
             current_frame = tile.get_current_frame()
             if current_frame:
-                screen_x = tile.x - self.camera_x
-                screen_y = tile.y - self.camera_y
-                # Only draw if on screen (basic culling for performance)
+                screen_x = tile_x - self.camera_x
+                screen_y = tile_y - self.camera_y
+                # Only draw if on screen (sectors are larger than the view)
                 if (-TILE_SIZE <= screen_x <= WIDTH and -TILE_SIZE <= screen_y <= HEIGHT):
-                    screen.blit(current_frame, (screen_x, screen_y))
+                    blit_sequence.append((current_frame, (screen_x, screen_y)))
+        if blit_sequence:
+            dirty_rects.extend(screen.blits(blit_sequence))
 
-        # Draw all entities
-        for entity in self.entities:
-            entity.draw(screen, self.camera_x, self.camera_y)
+        # Draw all entities that are within the camera view
+        view_rect = self.view_rect
+        for entity in self._drawables:
+            if view_rect.collidepoint(entity.x, entity.y):
+                entity.draw(screen, self.camera_x, self.camera_y)
+                dirty_rects.append(entity.get_draw_rect(self.camera_x, self.camera_y))
 
         # Draw UI with player reference
         if self.player:
             self.ui.draw(screen, self.player)
+            dirty_rects.append(self.ui.get_draw_rect(self.player))
+
+        self.dirty_rects = dirty_rects
 
         self.draw_debug_collision(screen)
 
@@ -1088,17 +1441,21 @@ class LevelLoader:
     def move_player(self, dx, dy):
         """Move the player if it exists and the move is valid"""
         if self.player:
-            level_width, level_height = self.get_level_size()
+            # Only the four cardinal directions move the player
+            step = MOVE_STEP_PX.get((dx, dy))
+            if step is None:
+                return False
 
             # Calculate new position in pixels
-            new_x = self.player.x + (dx * TILE_SIZE)
-            new_y = self.player.y + (dy * TILE_SIZE)
+            new_x = self.player.x + step[0]
+            new_y = self.player.y + step[1]
 
             # Check collision at new position
             if not self.is_position_blocked(new_x, new_y):
-                # Get current time in seconds
-                current_time = pygame.time.get_ticks() / 1000.0
-                return self.player.move(dx, dy, level_width, level_height, current_time)
+                # Use the tick of the current frame rather than reading the clock again
+                return self.player.move(
+                    dx, dy, self._level_w_px, self._level_h_px, self.current_time
+                )
             else:
                 # Movement blocked by collision
                 return False
@@ -1108,37 +1465,39 @@ class LevelLoader:
 ##############################################################
 # PYGAME ZERO IMPLEMENTATION
 
+# Configure logging once, before the first level loads; raise to DEBUG for loader detail
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
 # Global level loader instance
 level_loader = LevelLoader(LEVEL_SEQUENCE)
 
 
 def draw():
     """Pygame Zero draw function"""
-    screen.clear()
+    # No screen.clear(): the level loader repaints only the areas that changed
     level_loader.draw(screen.surface)
 
 
 def update():
     """Pygame Zero update function - handle continuous key presses with tile-based movement"""
+    # Read the clock once per tick and share it with everything updated this frame
+    now = pygame.time.get_ticks()
+
     # Update level (animated tiles and entities)
-    level_loader.update()
+    level_loader.update(now)
 
     # Handle debug mode toggle
-    if keyboard.d:
+    # Cooldown prevents rapid toggling without stalling the frame
+    if keyboard.d and now >= level_loader._debug_cooldown:
         toggle_debug_mode()
-        # Small delay to prevent rapid toggling
-        import time
-
-        time.sleep(0.2)
+        level_loader._debug_cooldown = now + DEBUG_TOGGLE_COOLDOWN
 
     # Handle attack input (SPACE key)
-    if keyboard.space:
+    # Cooldown prevents rapid attack spamming without stalling the frame
+    if keyboard.space and now >= level_loader._attack_cooldown:
         if level_loader.player:
-            level_loader.player.start_attack()
-        # Small delay to prevent rapid attack spamming
-        import time
-
-        time.sleep(0.1)
+            level_loader.player.start_attack(now)
+        level_loader._attack_cooldown = now + ATTACK_INPUT_COOLDOWN
 
     # Handle continuous movement (tile-by-tile while key is held)
     # Only allow one direction at a time to prevent diagonal movement